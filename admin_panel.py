@@ -15,12 +15,13 @@ import psutil
 from datetime import datetime
 from functools import wraps
 from flask import Flask, request, jsonify, render_template, redirect, url_for, session
+from memory_manager import CHAT_LOGS_FILE, read_chat_history, write_chat_history, count_chat_entries
 
 # --------------------------------------------------
 # Configuration
 # --------------------------------------------------
 ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "neura-admin-2025")
-CHAT_LOGS_PATH = "chat_logs.json"
+CHAT_LOGS_PATH = CHAT_LOGS_FILE  # JSON Lines, owned by memory_manager
 USER_PREFS_PATH = "user_profiles.json"
 MEMORY_PATH = "memory_store.json"
 IDEAS_PATH = "ideas_roadmap.json"
@@ -47,11 +48,25 @@ def _write_json(path, data):
 def _timestamp():
     return datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
 
+# CPU/memory readings are reused for up to a second instead of blocking each
+# request for a fresh 1s cpu_percent sample.
+_stats_cache = {"t": 0.0, "cpu": 0.0, "mem": 0.0}
+psutil.cpu_percent(interval=None)  # prime the counter; first reading is 0.0
+
+def _sampled_stats(min_interval=1.0):
+    now = time.monotonic()
+    if now - _stats_cache["t"] > min_interval:
+        _stats_cache["cpu"] = psutil.cpu_percent(interval=None)
+        _stats_cache["mem"] = psutil.virtual_memory().percent
+        _stats_cache["t"] = now
+    return _stats_cache
+
 def _system_info():
     """Collect live system statistics."""
+    stats = _sampled_stats()
     return {
-        "cpu_percent": psutil.cpu_percent(interval=1),
-        "memory_percent": psutil.virtual_memory().percent,
+        "cpu_percent": stats["cpu"],
+        "memory_percent": stats["mem"],
         "platform": platform.system(),
         "uptime": time.strftime("%H:%M:%S", time.gmtime(time.time())),
         "timestamp": _timestamp(),
@@ -86,14 +101,14 @@ def login_admin():
 @require_admin
 def dashboard():
     """Render a beautiful admin dashboard."""
-    chat_logs = _read_json(CHAT_LOGS_PATH).get("history", [])
+    chat_count = count_chat_entries(CHAT_LOGS_PATH)
     users = _read_json(USER_PREFS_PATH)
     ideas = _read_json(IDEAS_PATH)
     sys_info = _system_info()
 
     stats = {
         "total_users": len(users),
-        "total_chats": len(chat_logs),
+        "total_chats": chat_count,
         "cpu_usage": sys_info["cpu_percent"],
         "memory_usage": sys_info["memory_percent"],
         "system": sys_info["platform"],
@@ -164,7 +179,7 @@ def dashboard():
 @require_admin
 def clear_memory():
     _write_json(MEMORY_PATH, {"context": []})
-    _write_json(CHAT_LOGS_PATH, {"history": []})
+    write_chat_history([], CHAT_LOGS_PATH)
     return jsonify({"message": "🧠 Memory and logs cleared successfully."})
 
 
@@ -172,7 +187,7 @@ def clear_memory():
 @require_admin
 def export_backup():
     data = {
-        "chat_logs": _read_json(CHAT_LOGS_PATH),
+        "chat_logs": {"history": read_chat_history(CHAT_LOGS_PATH)},
         "memory": _read_json(MEMORY_PATH),
         "user_prefs": _read_json(USER_PREFS_PATH),
         "timestamp": _timestamp()
@@ -186,7 +201,7 @@ def export_backup():
 @require_admin
 def get_stats():
     sys_info = _system_info()
-    chat_count = len(_read_json(CHAT_LOGS_PATH).get("history", []))
+    chat_count = count_chat_entries(CHAT_LOGS_PATH)
     user_count = len(_read_json(USER_PREFS_PATH))
     return jsonify({
         "system": sys_info,
@@ -3,17 +3,30 @@ cpu_profiler.py
 Profiles CPU, memory, and system stats.
 """
 
+import time
 import psutil
 
+# Readings are reused for MIN_SAMPLE_INTERVAL seconds; cpu_percent(interval=None)
+# is non-blocking and reports usage since the previous call.
+MIN_SAMPLE_INTERVAL = 1.0
+_sample = {"t": 0.0, "stats": None}
+psutil.cpu_percent(interval=None)  # prime the counter; first reading is 0.0
+
 def profile_system() -> dict:
     """
     Returns CPU, RAM, and Disk usage statistics.
     """
-    return {
-        "cpu_percent": psutil.cpu_percent(interval=1),
-        "cpu_count": psutil.cpu_count(logical=True),
-        "ram_percent": psutil.virtual_memory().percent,
-        "ram_total_gb": round(psutil.virtual_memory().total / (1024**3), 2),
-        "disk_percent": psutil.disk_usage("/").percent,
-        "disk_total_gb": round(psutil.disk_usage("/").total / (1024**3), 2)
-    }
\ No newline at end of file
+    now = time.monotonic()
+    if _sample["stats"] is None or now - _sample["t"] > MIN_SAMPLE_INTERVAL:
+        vm = psutil.virtual_memory()
+        disk = psutil.disk_usage("/")
+        _sample["stats"] = {
+            "cpu_percent": psutil.cpu_percent(interval=None),
+            "cpu_count": psutil.cpu_count(logical=True),
+            "ram_percent": vm.percent,
+            "ram_total_gb": round(vm.total / (1024**3), 2),
+            "disk_percent": disk.percent,
+            "disk_total_gb": round(disk.total / (1024**3), 2)
+        }
+        _sample["t"] = now
+    return dict(_sample["stats"])
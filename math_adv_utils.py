@@ -4,8 +4,25 @@ Independent advanced math utilities for Neuraluxe-AI.
 """
 import math
 
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+def _as_array(x):
+    """float64 array for list/ndarray input (one vectorized pass), else None."""
+    if np is not None and isinstance(x, (list, tuple, np.ndarray)):
+        return np.asarray(x, dtype=np.float64)
+    return None
+
 def sigmoid(x):
+    arr = _as_array(x)
+    if arr is not None:
+        return 1.0 / (1.0 + np.exp(-arr))
     return 1 / (1 + math.exp(-x))
 
 def linear_scale(x, old_min, old_max, new_min, new_max):
-    return ((x - old_min)/(old_max - old_min))*(new_max - new_min) + new_min
\ No newline at end of file
+    arr = _as_array(x)
+    if arr is not None:
+        x = arr
+    return ((x - old_min)/(old_max - old_min))*(new_max - new_min) + new_min
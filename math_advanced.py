@@ -9,7 +9,13 @@ def factorial(n: int) -> int:
     return math.factorial(n)
 
 def fibonacci(n: int) -> int:
-    a, b = 0, 1
-    for _ in range(n):
-        a, b = b, a + b
-    return a
\ No newline at end of file
+    # Fast doubling over the bits of n: F(2k) = F(k)(2F(k+1) - F(k)),
+    # F(2k+1) = F(k)^2 + F(k+1)^2. O(log n) bigint multiplications.
+    if n <= 0:
+        return 0
+    a, b = 0, 1  # F(k), F(k+1)
+    for bit in bin(n)[2:]:
+        a, b = a * ((b << 1) - a), a * a + b * b
+        if bit == "1":
+            a, b = b, a + b
+    return a
@@ -7,6 +7,11 @@ import math
 import random
 from typing import List, Optional
 
+try:
+    import numpy as np
+except Exception:
+    np = None
+
 # ------------------------
 # Basic helpers
 # ------------------------
@@ -23,12 +28,23 @@ def percent_of(value: float, total: float) -> float:
 # ------------------------
 # Advanced calculations
 # ------------------------
+# Below this size the list -> array conversion costs more than it saves.
+NUMPY_MIN_SIZE = 256
+
+def _use_numpy(values) -> bool:
+    return np is not None and (isinstance(values, np.ndarray) or len(values) >= NUMPY_MIN_SIZE)
+
 def average(values: List[float]) -> float:
-    if not values: return 0
+    if len(values) == 0: return 0
+    if _use_numpy(values):
+        return float(np.mean(np.asarray(values, dtype=np.float64)))
     return sum(values) / len(values)
 
 def median(values: List[float]) -> float:
-    if not values: return 0
+    if len(values) == 0: return 0
+    if _use_numpy(values):
+        # np.median selects with introselect (O(n)) instead of a full sort
+        return float(np.median(np.asarray(values, dtype=np.float64)))
     sorted_vals = sorted(values)
     n = len(sorted_vals)
     mid = n // 2
@@ -65,11 +81,27 @@ def random_sample(values: List, k: int) -> List:
 # ------------------------
 # Trigonometry helpers
 # ------------------------
+# Lists/arrays of angles are converted once and evaluated in one NumPy
+# pass; scalars stay on the math module.
+def _radians_array(degrees):
+    if np is not None and isinstance(degrees, (list, tuple, np.ndarray)):
+        return np.deg2rad(np.asarray(degrees, dtype=np.float64))
+    return None
+
 def sin(degrees: float) -> float:
+    rad = _radians_array(degrees)
+    if rad is not None:
+        return np.sin(rad)
     return math.sin(math.radians(degrees))
 
 def cos(degrees: float) -> float:
+    rad = _radians_array(degrees)
+    if rad is not None:
+        return np.cos(rad)
     return math.cos(math.radians(degrees))
 
 def tan(degrees: float) -> float:
-    return math.tan(math.radians(degrees))
\ No newline at end of file
+    rad = _radians_array(degrees)
+    if rad is not None:
+        return np.tan(rad)
+    return math.tan(math.radians(degrees))
@@ -12,35 +12,140 @@ Handles dynamic AI memory:
 import os
 import json
 import time
+import atexit
+import threading
+from collections import deque
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+
+try:
+    import orjson
+except Exception:
+    orjson = None
 
 # Paths for memory files
 MEMORY_FILE = "memory_store.json"
-CHAT_LOGS_FILE = "chat_logs.json"
+CHAT_LOGS_FILE = "chat_logs.jsonl"  # one JSON entry per line, append-only
+LEGACY_CHAT_LOGS_FILE = "chat_logs.json"
 USER_PREF_FILE = "user_profiles.json"
+RECENT_CACHE_SIZE = 200  # newest history entries kept in memory
 
 # -------------------------------------------------------
 # Utility Functions
 # -------------------------------------------------------
 def _read_json(path: str) -> Any:
-    if not os.path.exists(path):
-        return {}
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except json.JSONDecodeError:
-        return {}
-    except Exception:
+        with open(path, "rb") as f:
+            return _loads(f.read())
+    except Exception:  # missing file or corrupt JSON (either decoder)
         return {}
 
+# Writes go to a background thread so callers never wait on disk. Only the
+# latest payload per path is kept, so a burst of updates is one write.
+_pending_writes: Dict[str, Any] = {}
+_pending_lock = threading.Lock()
+_pending_event = threading.Event()
+_flush_lock = threading.Lock()  # writer thread vs. the atexit flush
+
+def _dump_bytes(data: Any) -> bytes:
+    # Both encoders run in C without releasing the GIL, so the snapshot is
+    # consistent even though callers keep mutating `data`.
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+def _flush_file(path: str, data: Any) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_dump_bytes(data))
+    os.replace(tmp, path)  # readers never see a half-written file
+
+def _flush_pending() -> None:
+    with _flush_lock:
+        with _pending_lock:
+            batch = dict(_pending_writes)
+            _pending_writes.clear()
+            _pending_event.clear()
+        for path, data in batch.items():
+            try:
+                _flush_file(path, data)
+            except Exception as e:
+                print(f"⚠️ Failed to write {path}:", e)
+
+def _writer_loop() -> None:
+    while True:
+        _pending_event.wait()
+        _flush_pending()
+
+threading.Thread(target=_writer_loop, name="memory-writer", daemon=True).start()
+atexit.register(_flush_pending)
+
 def _write_json(path: str, data: Any) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    with _pending_lock:
+        _pending_writes[path] = data
+        _pending_event.set()
 
 def _timestamp() -> str:
     return datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
 
+# -------------------------------------------------------
+# Chat Log (JSON Lines)
+# -------------------------------------------------------
+def _loads(line: bytes) -> Any:
+    return orjson.loads(line) if orjson is not None else json.loads(line)
+
+def append_chat_entry(entry: Dict[str, Any], path: str = CHAT_LOGS_FILE) -> None:
+    """Append one history entry; O(1) however long the log is."""
+    with open(path, "ab") as f:
+        f.write(_dump_bytes(entry) + b"\n")
+
+def write_chat_history(history: List[Dict[str, Any]], path: str = CHAT_LOGS_FILE) -> None:
+    """Replace the whole log (clear/import only)."""
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.writelines(_dump_bytes(entry) + b"\n" for entry in history)
+    os.replace(tmp, path)
+
+def read_chat_history(path: str = CHAT_LOGS_FILE) -> List[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return []
+    with open(path, "rb") as f:
+        return [_loads(line) for line in f if line.strip()]
+
+def tail_chat_history(limit: int, path: str = CHAT_LOGS_FILE, block: int = 8192) -> List[Dict[str, Any]]:
+    """Last `limit` entries, reading backwards from the end of the file."""
+    if limit <= 0 or not os.path.exists(path):
+        return []
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        data = b""
+        while pos > 0 and data.count(b"\n") <= limit:
+            step = min(block, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    lines = [line for line in data.split(b"\n") if line.strip()]
+    if pos > 0:
+        lines = lines[1:]  # first line may be cut off mid-entry
+    return [_loads(line) for line in lines[-limit:]]
+
+def count_chat_entries(path: str = CHAT_LOGS_FILE) -> int:
+    if not os.path.exists(path):
+        return 0
+    count = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            count += chunk.count(b"\n")
+    return count
+
+def _migrate_legacy_chat_logs() -> None:
+    """One-off conversion of the old chat_logs.json into JSON Lines."""
+    if os.path.exists(CHAT_LOGS_FILE) or not os.path.exists(LEGACY_CHAT_LOGS_FILE):
+        return
+    legacy = _read_json(LEGACY_CHAT_LOGS_FILE)
+    write_chat_history(legacy.get("history", []) if isinstance(legacy, dict) else [])
+
 # -------------------------------------------------------
 # MemoryManager Class
 # -------------------------------------------------------
@@ -51,10 +156,15 @@ class MemoryManager:
 
     def __init__(self):
         self.memory = _read_json(MEMORY_FILE)
-        self.chat_logs = _read_json(CHAT_LOGS_FILE)
+        _migrate_legacy_chat_logs()
+        self._recent = None  # deque of the newest entries, filled on first use
+        self._message_count = None
+        self._last_active = None  # user -> latest timestamp, built on first use
         self.user_prefs = _read_json(USER_PREF_FILE)
         self.max_memory_length = 20_000  # characters
+        self.max_context_items = 500
         self.last_cleanup = None
+        self._memory_chars = self._context_chars()
 
     # ----------------------------
     # Conversation Memory
@@ -68,21 +178,41 @@ class MemoryManager:
             "response": response
         }
 
-        self.chat_logs.setdefault("history", []).append(entry)
-        _write_json(CHAT_LOGS_FILE, self.chat_logs)
+        append_chat_entry(entry)
+        if self._recent is not None:
+            self._recent.append(entry)
+        if self._message_count is not None:
+            self._message_count += 1
+        if self._last_active is not None:
+            self._last_active[user] = entry["timestamp"]
 
         # Add to memory summary
         self.memory.setdefault("context", []).append({
             "msg": message,
             "reply": response
         })
-        if len(json.dumps(self.memory)) > self.max_memory_length:
+        # Running size estimate instead of re-serializing all of memory per message
+        self._memory_chars += len(message) + len(response) + 20
+        if (len(self.memory["context"]) > self.max_context_items
+                or self._memory_chars > self.max_memory_length):
             self.optimize_memory()
         _write_json(MEMORY_FILE, self.memory)
 
+    def _context_chars(self) -> int:
+        """Approximate serialized size of the context (text + ~20 chars of JSON per pair)."""
+        return sum(len(m["msg"]) + len(m["reply"]) + 20 for m in self.memory.get("context", []))
+
+    def _recent_entries(self) -> deque:
+        if self._recent is None:
+            self._recent = deque(tail_chat_history(RECENT_CACHE_SIZE), maxlen=RECENT_CACHE_SIZE)
+        return self._recent
+
     def get_recent_conversation(self, limit: int = 5) -> List[Dict[str, Any]]:
         """Return recent conversation pairs."""
-        return self.chat_logs.get("history", [])[-limit:]
+        if limit > RECENT_CACHE_SIZE:
+            return tail_chat_history(limit)
+        recent = self._recent_entries()
+        return list(recent)[-limit:] if limit > 0 else []
 
     def summarize_memory(self) -> str:
         """Create a short memory summary for the AI model."""
@@ -96,15 +226,19 @@ class MemoryManager:
         """Trim old messages if memory grows too large."""
         if "context" in self.memory:
             self.memory["context"] = self.memory["context"][-50:]
+        self._memory_chars = self._context_chars()
         self.last_cleanup = _timestamp()
         _write_json(MEMORY_FILE, self.memory)
 
     def clear_memory(self) -> None:
         """Reset all AI memory."""
         self.memory = {"context": []}
-        self.chat_logs = {"history": []}
+        self._memory_chars = 0
+        write_chat_history([])
+        self._recent = deque(maxlen=RECENT_CACHE_SIZE)
+        self._message_count = 0
+        self._last_active = {}
         _write_json(MEMORY_FILE, self.memory)
-        _write_json(CHAT_LOGS_FILE, self.chat_logs)
         print("🧠 All memory cleared successfully.")
 
     # ----------------------------
@@ -132,7 +266,9 @@ class MemoryManager:
     # ----------------------------
     def count_messages(self) -> int:
         """Return total number of stored messages."""
-        return len(self.chat_logs.get("history", []))
+        if self._message_count is None:
+            self._message_count = count_chat_entries()
+        return self._message_count
 
     def get_active_users(self) -> List[str]:
         """List all user IDs with saved preferences."""
@@ -140,24 +276,33 @@ class MemoryManager:
 
     def get_last_active(self, user_id: str) -> Optional[str]:
         """Return last active timestamp of user."""
-        history = self.chat_logs.get("history", [])
-        for msg in reversed(history):
-            if msg["user"] == user_id:
-                return msg["timestamp"]
-        return None
+        if self._last_active is None:
+            # One pass over the log; later entries overwrite earlier ones
+            self._last_active = {m["user"]: m["timestamp"] for m in read_chat_history()}
+        return self._last_active.get(user_id)
 
     # ----------------------------
     # Export / Import
     # ----------------------------
     def export_memory(self, export_path: str = "memory_backup.json") -> None:
         """Backup memory and logs to single file."""
-        backup = {
-            "memory": self.memory,
-            "chat_logs": self.chat_logs,
-            "user_prefs": self.user_prefs,
-            "exported_at": _timestamp()
-        }
-        _write_json(export_path, backup)
+        # Streamed: the JSONL history lines are already JSON, so they're
+        # copied into the array as-is instead of being loaded and re-dumped.
+        tmp = export_path + ".tmp"
+        with open(tmp, "wb") as out:
+            out.write(b'{"memory":' + _dump_bytes(self.memory))
+            out.write(b',"chat_logs":{"history":[')
+            if os.path.exists(CHAT_LOGS_FILE):
+                with open(CHAT_LOGS_FILE, "rb") as log:
+                    sep = b""
+                    for line in log:
+                        line = line.strip()
+                        if line:
+                            out.write(sep + line)
+                            sep = b","
+            out.write(b']},"user_prefs":' + _dump_bytes(self.user_prefs))
+            out.write(b',"exported_at":' + _dump_bytes(_timestamp()) + b"}")
+        os.replace(tmp, export_path)
         print(f"📦 Memory backup saved to {export_path}")
 
     def import_memory(self, import_path: str) -> None:
@@ -169,10 +314,14 @@ class MemoryManager:
             with open(import_path, "r", encoding="utf-8") as f:
                 data = json.load(f)
                 self.memory = data.get("memory", {})
-                self.chat_logs = data.get("chat_logs", {})
+                self._memory_chars = self._context_chars()
+                history = data.get("chat_logs", {}).get("history", [])
                 self.user_prefs = data.get("user_prefs", {})
                 _write_json(MEMORY_FILE, self.memory)
-                _write_json(CHAT_LOGS_FILE, self.chat_logs)
+                write_chat_history(history)
+                self._recent = deque(history[-RECENT_CACHE_SIZE:], maxlen=RECENT_CACHE_SIZE)
+                self._message_count = len(history)
+                self._last_active = {m["user"]: m["timestamp"] for m in history}
                 _write_json(USER_PREF_FILE, self.user_prefs)
             print("✅ Memory restored successfully.")
         except Exception as e:
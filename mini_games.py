@@ -8,21 +8,42 @@ Integrated with NeuraAI core and user rewards.
 import random
 import json
 import time
-from typing import Dict, Any, List
+import atexit
+import threading
+from collections import Counter
+from typing import Dict, Any, List, Optional
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+try:
+    import orjson
+except Exception:
+    orjson = None
 
 GAMES_FILE = "game_data.json"
 REWARDS_FILE = "rewards_store.json"
+REWARDS_FLUSH_INTERVAL = 5.0  # seconds between background flushes
+REWARDS_FLUSH_EVERY = 100     # ...or sooner after this many updates
 
 def _load_json(path: str) -> Dict[str, Any]:
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            raw = f.read()
     except FileNotFoundError:
         return {}
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 def _save_json(path: str, data: Dict[str, Any]):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Compact bytes, no indent: game_data.json holds 1,000+ games
+    if orjson is not None:
+        raw = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        raw = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(raw)
 
 def load_games() -> List[Dict[str, Any]]:
     data = _load_json(GAMES_FILE)
@@ -31,10 +52,8 @@ def load_games() -> List[Dict[str, Any]]:
         return []
     return data.get("games", [])
 
-def add_game(title: str, category: str, difficulty: str, prompt: str, answer: str):
-    data = _load_json(GAMES_FILE)
-    game_id = f"game_{int(time.time()*1000)}"
-    game = {
+def _make_game(game_id: str, title: str, category: str, difficulty: str, prompt: str, answer: str):
+    return {
         "id": game_id,
         "title": title,
         "category": category,
@@ -43,6 +62,10 @@ def add_game(title: str, category: str, difficulty: str, prompt: str, answer: st
         "answer": answer,
         "timestamp": time.time(),
     }
+
+def add_game(title: str, category: str, difficulty: str, prompt: str, answer: str):
+    data = _load_json(GAMES_FILE)
+    game = _make_game(f"game_{int(time.time()*1000)}", title, category, difficulty, prompt, answer)
     data.setdefault("games", []).append(game)
     _save_json(GAMES_FILE, data)
     return game
@@ -65,27 +88,86 @@ def play_game(game: Dict[str, Any]):
     reward_user("player", 10 if correct else 2)
     return correct
 
+# Scores live in memory and are flushed to REWARDS_FILE in the background,
+# so awarding points is O(1) and concurrent games can't lose each other's
+# writes with a read-modify-write of the whole file.
+_rewards: Optional[Counter] = None
+_rewards_lock = threading.Lock()
+_rewards_flush_lock = threading.Lock()
+_rewards_dirty = 0
+_rewards_wake = threading.Event()
+
+def _rewards_store() -> Counter:
+    global _rewards
+    if _rewards is None:
+        with _rewards_lock:
+            if _rewards is None:
+                _rewards = Counter(_load_json(REWARDS_FILE))
+    return _rewards
+
+def flush_rewards():
+    global _rewards_dirty
+    with _rewards_flush_lock:
+        with _rewards_lock:
+            if not _rewards_dirty:
+                return
+            snapshot = dict(_rewards)
+            _rewards_dirty = 0
+            _rewards_wake.clear()
+        _save_json(REWARDS_FILE, snapshot)
+
+def _rewards_flusher():
+    while True:
+        _rewards_wake.wait(REWARDS_FLUSH_INTERVAL)
+        try:
+            flush_rewards()
+        except Exception as e:
+            print("⚠️ Failed to save rewards:", e)
+
+threading.Thread(target=_rewards_flusher, name="rewards-flusher", daemon=True).start()
+atexit.register(flush_rewards)
+
 def reward_user(user: str, points: int):
-    data = _load_json(REWARDS_FILE)
-    data[user] = data.get(user, 0) + points
-    _save_json(REWARDS_FILE, data)
+    global _rewards_dirty
+    store = _rewards_store()
+    with _rewards_lock:
+        store[user] += points
+        _rewards_dirty += 1
+        if _rewards_dirty >= REWARDS_FLUSH_EVERY:
+            _rewards_wake.set()
 
 def get_user_score(user: str):
-    data = _load_json(REWARDS_FILE)
-    return data.get(user, 0)
+    return _rewards_store().get(user, 0)
 
-def bootstrap_games():
+def bootstrap_games(count: int = 1000):
     """Preload hundreds of games in various categories"""
     categories = ["math", "science", "anime", "geography", "coding", "history", "logic"]
-    for i in range(1, 1001):
-        add_game(
-            title=f"Hyper Challenge {i}",
-            category=random.choice(categories),
-            difficulty=random.choice(["easy", "medium", "hard"]),
-            prompt=f"What is {i} + {random.randint(1,100)}?",
-            answer=str(i + random.randint(1,100)),
+    difficulties = ["easy", "medium", "hard"]
+    # Draw every random field in one batch and write the file once,
+    # instead of 4 random calls and a full load/save per game.
+    if np is not None:
+        cats = np.random.choice(categories, size=count).tolist()
+        diffs = np.random.choice(difficulties, size=count).tolist()
+        addends = np.random.randint(1, 101, size=count).tolist()
+    else:
+        cats = random.choices(categories, k=count)
+        diffs = random.choices(difficulties, k=count)
+        addends = [random.randint(1, 100) for _ in range(count)]
+    base_id = int(time.time() * 1000)
+    data = _load_json(GAMES_FILE)
+    data.setdefault("games", []).extend(
+        _make_game(
+            f"game_{base_id}_{i}",
+            f"Hyper Challenge {i}",
+            cat,
+            diff,
+            f"What is {i} + {add}?",
+            str(i + add),
         )
-    print("✅ 1,000 games preloaded successfully!")
+        for i, cat, diff, add in zip(range(1, count + 1), cats, diffs, addends)
+    )
+    _save_json(GAMES_FILE, data)
+    print(f"✅ {count:,} games preloaded successfully!")
 
 if __name__ == "__main__":
     print("🕹️ Welcome to NeuraAI Hyperluxe Games")
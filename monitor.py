@@ -4,12 +4,18 @@
 # ===========================================================
 
 import os
+import json
 import time
+import asyncio
 import logging
-import redis
-import requests
+import aiohttp
+import redis.asyncio as aioredis
 from datetime import datetime
-from threading import Thread
+
+try:
+    import orjson
+except Exception:
+    orjson = None
 
 # -----------------------------
 # Logging Configuration
@@ -32,74 +38,110 @@ ENABLE_ERROR_MONITORING = os.getenv("ENABLE_ERROR_MONITORING", "true").lower() =
 # -----------------------------
 # Redis Connection
 # -----------------------------
+# One pool shared by every coroutine on the loop; from_url is lazy, the
+# first command opens the connection.
 try:
-    redis_client = redis.from_url(REDIS_URL)
-    logger.info("Connected to Redis successfully.")
+    redis_client = aioredis.from_url(REDIS_URL, max_connections=8, decode_responses=True)
+    logger.info("Redis client configured.")
 except Exception as e:
     logger.error(f"Redis connection failed: {e}")
     redis_client = None
 
 # -----------------------------
-# Dummy Metrics & Analytics
+# HTTP Session (keep-alive)
+# -----------------------------
+# One pooled session so each poll reuses the warm TLS connection instead of
+# a fresh TCP + TLS handshake per request. Created in main() because
+# aiohttp sessions must be opened inside the running loop.
+http_session = None
+COINGECKO_PRICE_URL = "https://api.coingecko.com/api/v3/simple/price?ids=bitcoin,ethereum&vs_currencies=usd"
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
 # -----------------------------
-def track_user_activity():
+# Fixed-Cadence Scheduling
+# -----------------------------
+async def every(period: float):
+    """Yield every `period` seconds on the monotonic clock. Work time is
+    subtracted from the sleep, so the cadence doesn't drift; after an
+    overrun the schedule restarts from now instead of firing a burst."""
+    next_t = time.monotonic()
     while True:
+        yield
+        next_t += period
+        delay = next_t - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        else:
+            next_t = time.monotonic()
+
+# -----------------------------
+# Dummy Metrics & Analytics
+# -----------------------------
+async def track_user_activity():
+    async for _ in every(30):  # every 30 seconds
         try:
             if ENABLE_USER_ANALYTICS and redis_client:
                 # Simulate user activity tracking
-                active_users = int(redis_client.get("active_users") or 0)
-                active_users += 1
-                redis_client.set("active_users", active_users)
+                active_users = await redis_client.incr("active_users")  # atomic, one round trip
                 logger.info(f"Active users count: {active_users}")
         except Exception as e:
             if ENABLE_ERROR_MONITORING:
                 logger.error(f"User activity tracking error: {e}")
-        time.sleep(30)  # every 30 seconds
 
-def track_crypto_data():
-    while True:
+async def track_crypto_data():
+    async for _ in every(60):  # every minute
         try:
             if ENABLE_CRYPTO_ANALYTICS:
                 # Fetch dummy crypto price
-                response = requests.get("https://api.coingecko.com/api/v3/simple/price?ids=bitcoin,ethereum&vs_currencies=usd")
-                if response.status_code == 200:
-                    data = response.json()
-                    logger.info(f"Crypto Prices: BTC ${data['bitcoin']['usd']} | ETH ${data['ethereum']['usd']}")
-                else:
-                    logger.warning("Failed to fetch crypto prices.")
+                async with http_session.get(COINGECKO_PRICE_URL, timeout=HTTP_TIMEOUT) as response:
+                    if response.status == 200:
+                        body = await response.read()
+                        data = orjson.loads(body) if orjson else json.loads(body)
+                        logger.info(f"Crypto Prices: BTC ${data['bitcoin']['usd']} | ETH ${data['ethereum']['usd']}")
+                    else:
+                        logger.warning("Failed to fetch crypto prices.")
         except Exception as e:
             if ENABLE_ERROR_MONITORING:
                 logger.error(f"Crypto tracking error: {e}")
-        time.sleep(60)  # every minute
 
-def track_system_metrics():
-    while True:
+async def track_system_metrics():
+    async for _ in every(45):
         try:
             if ENABLE_METRICS and redis_client:
                 # Example: memory and CPU dummy metrics
-                memory_usage = redis_client.info().get("used_memory_human", "0B")
-                clients_connected = redis_client.info().get("connected_clients", 0)
+                # Only the sections we read, not the full INFO dump (twice)
+                memory_info, clients_info = await asyncio.gather(
+                    redis_client.info("memory"), redis_client.info("clients")
+                )
+                memory_usage = memory_info.get("used_memory_human", "0B")
+                clients_connected = clients_info.get("connected_clients", 0)
                 logger.info(f"System Metrics -> Memory: {memory_usage} | Redis Clients: {clients_connected}")
         except Exception as e:
             if ENABLE_ERROR_MONITORING:
                 logger.error(f"System metrics error: {e}")
-        time.sleep(45)
 
 # -----------------------------
-# Start Monitoring Threads
+# Run Monitoring Tasks
 # -----------------------------
+# All three trackers share one event loop (and one Redis pool / HTTP
+# session) instead of three mostly-sleeping OS threads.
+async def main():
+    global http_session
+    async with aiohttp.ClientSession() as session:
+        http_session = session
+        try:
+            await asyncio.gather(
+                track_user_activity(),
+                track_crypto_data(),
+                track_system_metrics(),
+            )
+        finally:
+            if redis_client:
+                await redis_client.aclose()
+
 if __name__ == "__main__":
     logger.info("Starting Neuraluxe-AI Monitoring Worker...")
-
-    threads = [
-        Thread(target=track_user_activity, daemon=True),
-        Thread(target=track_crypto_data, daemon=True),
-        Thread(target=track_system_metrics, daemon=True)
-    ]
-
-    for t in threads:
-        t.start()
-
-    # Keep the main thread alive
-    while True:
-        time.sleep(60)
\ No newline at end of file
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -4,9 +4,21 @@ mood_palette.py
 Generates color palettes based on mood, text, or input parameters.
 """
 
+import re
 import random
+from functools import lru_cache
 from colorsys import rgb_to_hsv, hsv_to_rgb
 
+try:
+    import ahocorasick
+except Exception:
+    ahocorasick = None
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
 # Predefined moods with representative colors
 MOODS = {
     "happy": ["#FFD700", "#FFB347", "#FF69B4", "#ADFF2F", "#00FF7F"],
@@ -18,6 +30,16 @@ MOODS = {
     "mysterious": ["#4B0082", "#800080", "#483D8B", "#6A5ACD", "#2F4F4F"]
 }
 
+@lru_cache(maxsize=4096)
+def _parse(color: str) -> tuple:
+    """'#RRGGBB' -> (r, g, b); each distinct color is parsed once."""
+    return int(color[1:3],16), int(color[3:5],16), int(color[5:7],16)
+
+def _hex(r: int, g: int, b: int) -> str:
+    return "#%02X%02X%02X" % (r, g, b)
+
+MOODS_RGB = {mood: [_parse(c) for c in colors] for mood, colors in MOODS.items()}
+
 def generate_palette_from_mood(mood: str) -> list[str]:
     """Generate a palette based on the mood input."""
     return MOODS.get(mood.lower(), generate_random_palette())
@@ -31,31 +53,59 @@ def generate_random_palette(n: int = 5) -> list[str]:
 
 def blend_colors(color1: str, color2: str, ratio: float = 0.5) -> str:
     """Blend two hex colors by a ratio."""
-    r1, g1, b1 = int(color1[1:3],16), int(color1[3:5],16), int(color1[5:7],16)
-    r2, g2, b2 = int(color2[1:3],16), int(color2[3:5],16), int(color2[5:7],16)
+    r1, g1, b1 = _parse(color1)
+    r2, g2, b2 = _parse(color2)
     r = int(r1*(1-ratio)+r2*ratio)
     g = int(g1*(1-ratio)+g2*ratio)
     b = int(b1*(1-ratio)+b2*ratio)
-    return f"#{r:02X}{g:02X}{b:02X}"
+    return _hex(r, g, b)
+
+MOOD_KEYWORDS = {
+    "happy":["joy","fun","laugh","smile","love"],
+    "sad":["cry","lonely","sad","gloom","tears"],
+    "angry":["hate","anger","furious","rage","annoyed"],
+    "relaxed":["calm","peace","quiet","serene","chill"],
+    "romantic":["love","kiss","date","heart","romance"],
+    "energetic":["excited","run","jump","move","power"],
+    "mysterious":["dark","hidden","secret","unknown","shadow"]
+}
+_MOOD_NAMES = list(MOOD_KEYWORDS)
+
+# keyword -> indices of every mood it scores for ("love" counts twice)
+_KEYWORD_MOODS = {}
+for _i, _words in enumerate(MOOD_KEYWORDS.values()):
+    for _word in _words:
+        _KEYWORD_MOODS[_word] = _KEYWORD_MOODS.get(_word, ()) + (_i,)
+
+# The text is scanned once for all keywords: with pyahocorasick's automaton
+# when installed, otherwise with one precompiled regex whose hits are looked
+# up in _KEYWORD_MOODS. The lookahead reports every (possibly overlapping)
+# occurrence, so both paths count substrings exactly like str.count did.
+_KEYWORD_AUTOMATON = None
+if ahocorasick is not None:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _word, _idxs in _KEYWORD_MOODS.items():
+        _KEYWORD_AUTOMATON.add_word(_word, _idxs)
+    _KEYWORD_AUTOMATON.make_automaton()
+
+_KEYWORD_RE = re.compile(
+    "(?=(%s))" % "|".join(map(re.escape, sorted(_KEYWORD_MOODS, key=len, reverse=True)))
+)
 
 def mood_from_text(text: str) -> str:
     """Simple heuristic to detect mood from text."""
-    keywords = {
-        "happy":["joy","fun","laugh","smile","love"],
-        "sad":["cry","lonely","sad","gloom","tears"],
-        "angry":["hate","anger","furious","rage","annoyed"],
-        "relaxed":["calm","peace","quiet","serene","chill"],
-        "romantic":["love","kiss","date","heart","romance"],
-        "energetic":["excited","run","jump","move","power"],
-        "mysterious":["dark","hidden","secret","unknown","shadow"]
-    }
     text_lower = text.lower()
-    scores = {k:0 for k in keywords}
-    for mood, words in keywords.items():
-        for word in words:
-            scores[mood] += text_lower.count(word)
-    top_mood = max(scores, key=lambda x:scores[x])
-    return top_mood if scores[top_mood] > 0 else "neutral"
+    scores = [0] * len(_MOOD_NAMES)
+    if _KEYWORD_AUTOMATON is not None:
+        for _, idxs in _KEYWORD_AUTOMATON.iter(text_lower):
+            for i in idxs:
+                scores[i] += 1
+    else:
+        for word in _KEYWORD_RE.findall(text_lower):
+            for i in _KEYWORD_MOODS[word]:
+                scores[i] += 1
+    top = max(range(len(scores)), key=scores.__getitem__)
+    return _MOOD_NAMES[top] if scores[top] > 0 else "neutral"
 
 def generate_palette_from_text(text: str) -> list[str]:
     """Generate a palette based on detected mood from text."""
@@ -66,28 +116,86 @@ def generate_palette_from_text(text: str) -> list[str]:
 
 def complementary_color(color: str) -> str:
     """Return the complementary hex color."""
-    r, g, b = int(color[1:3],16), int(color[3:5],16), int(color[5:7],16)
-    return f"#{255-r:02X}{255-g:02X}{255-b:02X}"
+    r, g, b = _parse(color)
+    return _hex(255-r, 255-g, 255-b)
 
 def analogous_colors(color: str) -> list[str]:
     """Generate 2 analogous colors."""
-    r, g, b = int(color[1:3],16)/255, int(color[3:5],16)/255, int(color[5:7],16)/255
-    h, s, v = rgb_to_hsv(r,g,b)
+    r, g, b = _parse(color)
+    h, s, v = rgb_to_hsv(r/255, g/255, b/255)
     h1, h2 = (h+0.05)%1.0, (h-0.05)%1.0
     c1 = hsv_to_rgb(h1,s,v)
     c2 = hsv_to_rgb(h2,s,v)
-    return [f"#{int(c1[0]*255):02X}{int(c1[1]*255):02X}{int(c1[2]*255):02X}",
-            f"#{int(c2[0]*255):02X}{int(c2[1]*255):02X}{int(c2[2]*255):02X}"]
+    return [_hex(int(c1[0]*255), int(c1[1]*255), int(c1[2]*255)),
+            _hex(int(c2[0]*255), int(c2[1]*255), int(c2[2]*255))]
 
 def triadic_colors(color: str) -> list[str]:
     """Generate 2 triadic colors."""
-    r, g, b = int(color[1:3],16)/255, int(color[3:5],16)/255, int(color[5:7],16)/255
-    h, s, v = rgb_to_hsv(r,g,b)
-    h1, h2 = (h+1/3)%1.0, (h+2/3)%1.0
-    c1 = hsv_to_rgb(h1,s,v)
-    c2 = hsv_to_rgb(h2,s,v)
-    return [f"#{int(c1[0]*255):02X}{int(c1[1]*255):02X}{int(c1[2]*255):02X}",
-            f"#{int(c2[0]*255):02X}{int(c2[1]*255):02X}{int(c2[2]*255):02X}"]
+    # A 120°/240° hue rotation keeps S and V and just cycles the channels,
+    # so no HSV round-trip (and no float truncation off-by-ones) is needed.
+    r, g, b = _parse(color)
+    return [_hex(b, r, g), _hex(g, b, r)]
+
+# ------------------------
+# Batch variants (NumPy)
+# ------------------------
+# For many colors at once: (N, 3) uint8 RGB arrays in, one vectorized HSV
+# round-trip instead of N colorsys calls. Same arithmetic as colorsys, so
+# results match the scalar functions above.
+def _rgb_to_hsv_batch(rgb):
+    r, g, b = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+    maxc = rgb.max(axis=1)
+    minc = rgb.min(axis=1)
+    delta = maxc - minc
+    gray = delta == 0
+    safe = np.where(gray, 1.0, delta)
+    s = np.where(gray, 0.0, delta / np.where(maxc == 0, 1.0, maxc))
+    rc = (maxc - r) / safe
+    gc = (maxc - g) / safe
+    bc = (maxc - b) / safe
+    h = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+    h = np.where(gray, 0.0, (h / 6.0) % 1.0)
+    return h, s, maxc
+
+def _hsv_to_rgb_batch(h, s, v):
+    i = (h * 6.0).astype(np.int64)
+    f = (h * 6.0) - i
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    i = i % 6
+    r = np.choose(i, [v, q, p, p, t, v])
+    g = np.choose(i, [t, v, v, q, p, p])
+    b = np.choose(i, [p, p, t, v, v, q])
+    rgb = np.stack([r, g, b], axis=1)
+    return np.where((s == 0.0)[:, None], v[:, None], rgb)
+
+def _rotate_hue_batch(colors, offsets):
+    rgb = np.asarray(colors, dtype=np.float64).reshape(-1, 3) / 255
+    h, s, v = _rgb_to_hsv_batch(rgb)
+    out = [_hsv_to_rgb_batch((h + off) % 1.0, s, v) for off in offsets]
+    return (np.stack(out, axis=1) * 255).astype(np.uint8)
+
+def analogous_batch(colors):
+    """(N, 3) RGB -> (N, 2, 3) uint8 analogous pairs."""
+    return _rotate_hue_batch(colors, (0.05, -0.05))
+
+def triadic_batch(colors):
+    """(N, 3) RGB -> (N, 2, 3) uint8 triadic pairs."""
+    rgb = np.asarray(colors, dtype=np.uint8).reshape(-1, 3)
+    return np.stack([rgb[:, [2, 0, 1]], rgb[:, [1, 2, 0]]], axis=1)
+
+def blend_batch(colors1, colors2, ratio: float = 0.5):
+    """Blend two (N, 3) RGB arrays row by row."""
+    c1 = np.asarray(colors1, dtype=np.float64)
+    c2 = np.asarray(colors2, dtype=np.float64)
+    return (c1*(1-ratio) + c2*ratio).astype(np.uint8)
+
+def hex_to_rgb_array(colors: list[str]):
+    return np.array([_parse(c) for c in colors], dtype=np.uint8).reshape(-1, 3)
+
+def rgb_array_to_hex(rgb) -> list[str]:
+    return [_hex(r, g, b) for r, g, b in np.asarray(rgb).reshape(-1, 3).tolist()]
 
 # ------------------------
 # Example usage
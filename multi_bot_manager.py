@@ -6,28 +6,93 @@ Manages up to 50 AI trading bots per user with async control, scaling, and monit
 import asyncio
 import random
 import time
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+STARTING_BALANCE = 10000.0
+TICK_BATCH = 256  # sleep/profit draws pre-generated per refill
+
+class BotLedger:
+    """Per-bot numbers stored column-wise (one array per field), so fleet
+    totals are a single sum instead of a loop over bots and trade logs."""
+    def __init__(self, size: int):
+        if np is not None:
+            self.balances = np.full(size, STARTING_BALANCE)
+            self.profit_sums = np.zeros(size)
+            self.trade_counts = np.zeros(size, dtype=np.int64)
+        else:
+            self.balances = [STARTING_BALANCE] * size
+            self.profit_sums = [0.0] * size
+            self.trade_counts = [0] * size
+        self._free = list(range(size - 1, -1, -1))
+
+    def allocate(self) -> int:
+        return self._free.pop()
+
+    def release(self, slot: int):
+        self.balances[slot] = STARTING_BALANCE
+        self.profit_sums[slot] = 0.0
+        self.trade_counts[slot] = 0
+        self._free.append(slot)
+
+    def record(self, slot: int, profit: float):
+        self.balances[slot] += profit
+        self.profit_sums[slot] += profit
+        self.trade_counts[slot] += 1
+
+    def totals(self):
+        """(total profit, total trades) over every slot."""
+        if np is not None:
+            return float(self.profit_sums.sum()), int(self.trade_counts.sum())
+        return sum(self.profit_sums), sum(self.trade_counts)
 
 class TradingBot:
-    def __init__(self, bot_id: int, strategy: str):
+    def __init__(self, bot_id: int, strategy: str, ledger: Optional[BotLedger] = None, rng=None):
         self.bot_id = bot_id
         self.strategy = strategy
         self.active = False
-        self.balance = 10000.0
-        self.profit_log = []
+        self.ledger = ledger if ledger is not None else BotLedger(1)
+        self.slot = self.ledger.allocate()
         self.start_time = None
+        self.rng = rng if rng is not None or np is None else np.random.default_rng()
+        self._sleeps: List[float] = []
+        self._profits: List[float] = []
+        self._tick = 0
+
+    def _next_tick(self):
+        """(sleep seconds, profit) for the next cycle, drawn TICK_BATCH at a time."""
+        if self.rng is None:
+            return random.uniform(1.0, 3.0), round(random.uniform(-100, 150), 2)
+        if self._tick >= len(self._sleeps):
+            self._sleeps = self.rng.uniform(1.0, 3.0, TICK_BATCH).tolist()
+            self._profits = self.rng.uniform(-100, 150, TICK_BATCH).round(2).tolist()
+            self._tick = 0
+        i = self._tick
+        self._tick += 1
+        return self._sleeps[i], self._profits[i]
+
+    @property
+    def balance(self) -> float:
+        return float(self.ledger.balances[self.slot])
+
+    @property
+    def trade_count(self) -> int:
+        return int(self.ledger.trade_counts[self.slot])
     
     async def run(self):
         """Simulates trading cycles asynchronously."""
         self.active = True
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         print(f"[BOT-{self.bot_id}] Started with strategy: {self.strategy}")
         try:
             while self.active:
-                await asyncio.sleep(random.uniform(1.0, 3.0))
-                profit = round(random.uniform(-100, 150), 2)
-                self.balance += profit
-                self.profit_log.append(profit)
+                delay, profit = self._next_tick()
+                await asyncio.sleep(delay)
+                self.ledger.record(self.slot, profit)
                 print(f"[BOT-{self.bot_id}] Profit tick: {profit} | Balance: {self.balance:.2f}")
         except asyncio.CancelledError:
             print(f"[BOT-{self.bot_id}] gracefully stopped.")
@@ -42,14 +107,16 @@ class MultiBotManager:
         self.max_bots = max_bots
         self.bots: Dict[int, TradingBot] = {}
         self.tasks: Dict[int, asyncio.Task] = {}
+        self.ledger = BotLedger(max_bots)
+        self.rng = np.random.default_rng() if np is not None else None
     
     def create_bot(self, strategy: str) -> str:
         """Create a new bot with a specific strategy."""
         if len(self.bots) >= self.max_bots:
             return "Bot limit reached. Upgrade required to deploy more bots."
         
-        bot_id = len(self.bots) + 1
-        bot = TradingBot(bot_id, strategy)
+        bot_id = max(self.bots, default=0) + 1  # never reuse a live id
+        bot = TradingBot(bot_id, strategy, self.ledger, self.rng)
         self.bots[bot_id] = bot
         print(f"[MANAGER] Created bot #{bot_id} with strategy '{strategy}'")
         return f"Bot #{bot_id} ready."
@@ -58,7 +125,8 @@ class MultiBotManager:
         """Start all bots concurrently."""
         print("[MANAGER] Launching all bots...")
         for bot_id, bot in self.bots.items():
-            if not bot.active:
+            task = self.tasks.get(bot_id)
+            if task is None or task.done():
                 self.tasks[bot_id] = asyncio.create_task(bot.run())
         print(f"[MANAGER] {len(self.tasks)} bots are now running.")
     
@@ -67,27 +135,31 @@ class MultiBotManager:
         print("[MANAGER] Stopping all bots...")
         for bot in self.bots.values():
             bot.stop()
-        for task in self.tasks.values():
-            task.cancel()
+        tasks = list(self.tasks.values())
         self.tasks.clear()
-        await asyncio.sleep(1)
+        for task in tasks:
+            task.cancel()
+        # Wait for the cancellations themselves rather than a fixed sleep
+        await asyncio.gather(*tasks, return_exceptions=True)
         print("[MANAGER] All bots stopped.")
 
+    def iter_status_report(self) -> Iterator[str]:
+        """Yield one status line per bot (stream with "\n".join)."""
+        now = time.monotonic()
+        balances = self.ledger.balances
+        counts = self.ledger.trade_counts
+        for bot_id, bot in self.bots.items():
+            uptime = (now - bot.start_time) if bot.start_time else 0
+            yield "Bot %d | Strategy: %s | Balance: %.2f | Trades: %d | Uptime: %.1fs" % (
+                bot_id, bot.strategy, balances[bot.slot], counts[bot.slot], uptime)
+
     def bot_status_report(self) -> List[str]:
         """Return detailed status for all bots."""
-        report = []
-        for bot_id, bot in self.bots.items():
-            uptime = (time.time() - bot.start_time) if bot.start_time else 0
-            report.append(
-                f"Bot {bot_id} | Strategy: {bot.strategy} | Balance: {bot.balance:.2f} | "
-                f"Trades: {len(bot.profit_log)} | Uptime: {uptime:.1f}s"
-            )
-        return report
+        return list(self.iter_status_report())
 
     def get_average_profit(self) -> float:
         """Calculate average profit across all bots."""
-        total_profit = sum(sum(bot.profit_log) for bot in self.bots.values())
-        total_trades = sum(len(bot.profit_log) for bot in self.bots.values())
+        total_profit, total_trades = self.ledger.totals()
         return total_profit / total_trades if total_trades else 0
 
     def remove_bot(self, bot_id: int) -> str:
@@ -95,8 +167,10 @@ class MultiBotManager:
         if bot_id not in self.bots:
             return f"Bot #{bot_id} not found."
         self.bots[bot_id].stop()
-        self.bots.pop(bot_id)
-        self.tasks.pop(bot_id, None)
+        task = self.tasks.pop(bot_id, None)
+        if task is not None:
+            task.cancel()  # must not record into the slot after it's freed
+        self.ledger.release(self.bots.pop(bot_id).slot)
         return f"Bot #{bot_id} removed."
 
     def quick_summary(self):
@@ -5,33 +5,73 @@ Independent and ready for Neuraluxe-AI.
 """
 
 import os
+import json
 import random
 import importlib.util
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 # Folder where joke files are stored
 JOKE_FOLDER = "jokes"  # make sure all joke files are inside a folder named 'jokes'
+# Pre-built bundle of every JOKES list; see build_joke_bundle()
+JOKE_BUNDLE = os.path.join(JOKE_FOLDER, "jokes.json")
+
+# file_path -> (mtime, jokes); a file is only re-executed after it changes
+_JOKE_CACHE = {}
 
-def load_jokes_from_file(file_path: str):
+def load_jokes_from_file(file_path: str, mtime: float = None):
     """Load the JOKES list from a Python file dynamically."""
+    if mtime is None:
+        mtime = os.path.getmtime(file_path)
+    cached = _JOKE_CACHE.get(file_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
     spec = importlib.util.spec_from_file_location("joke_module", file_path)
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
+    jokes = []
     if hasattr(module, "JOKES") and isinstance(module.JOKES, list):
-        return module.JOKES
-    return []
+        jokes = module.JOKES
+    _JOKE_CACHE[file_path] = (mtime, jokes)
+    return jokes
+
+def load_joke_bundle(path: str = JOKE_BUNDLE):
+    """Read the pre-built JSON bundle; plain data, nothing to compile."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+def build_joke_bundle(path: str = JOKE_BUNDLE):
+    """Collect the JOKES lists from the .py files into one JSON bundle."""
+    jokes = load_jokes_from_files()
+    data = orjson.dumps(jokes) if orjson is not None else json.dumps(jokes, ensure_ascii=False).encode("utf-8")
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return len(jokes)
 
 def load_all_jokes():
+    """Load jokes from the bundle if built, else from the Python files in JOKE_FOLDER."""
+    if os.path.isfile(JOKE_BUNDLE):
+        return load_joke_bundle()
+    return load_jokes_from_files()
+
+def load_jokes_from_files():
     """Load jokes from all Python files in JOKE_FOLDER."""
     all_jokes = []
     if not os.path.isdir(JOKE_FOLDER):
         print(f"[Warning] Joke folder '{JOKE_FOLDER}' does not exist.")
         return all_jokes
 
-    for filename in os.listdir(JOKE_FOLDER):
-        if filename.endswith(".py"):
-            file_path = os.path.join(JOKE_FOLDER, filename)
-            jokes = load_jokes_from_file(file_path)
-            all_jokes.extend(jokes)
+    # scandir hands back the path and cached stat info in one pass
+    with os.scandir(JOKE_FOLDER) as it:
+        for entry in it:
+            if entry.name.endswith(".py") and entry.is_file():
+                all_jokes.extend(load_jokes_from_file(entry.path, entry.stat().st_mtime))
     return all_jokes
 
 class JokeProvider:
@@ -48,5 +88,9 @@ class JokeProvider:
 # Example usage
 # ------------------------
 if __name__ == "__main__":
+    import sys
+    if "--build" in sys.argv:
+        print(f"Bundled {build_joke_bundle()} jokes into {JOKE_BUNDLE}")
+        sys.exit(0)
     jp = JokeProvider()
     print(jp.tell_joke())
\ No newline at end of file
@@ -5,6 +5,16 @@ Premium version with 300+ challenges and dynamic puzzle generators.
 """
 
 import random
+import operator
+
+# Operator symbol -> function, so solutions are computed without eval()
+_OPS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "//": operator.floordiv,
+    "%": operator.mod,
+}
 
 class MysteryPuzzleCreator:
     def __init__(self):
@@ -30,6 +40,10 @@ class MysteryPuzzleCreator:
         self.subjects = ["artifact", "document", "painting", "message", "statue", "goblet", "scroll"]
         self.places = ["museum", "library", "castle", "laboratory", "hidden chamber", "observatory"]
 
+        # Scramble words with their letters pre-split, so each call only shuffles
+        word_bank = ["mystery", "puzzle", "enigma", "riddle", "labyrinth", "conundrum", "cipher"]
+        self._scramble_words = [(w, list(w)) for w in word_bank]
+
     # -----------------------------
     # Riddles
     # -----------------------------
@@ -52,7 +66,7 @@ class MysteryPuzzleCreator:
             solution = "Depends on pattern"
         else:
             puzzle = puzzle_template.format(a=a, b=b, op=op)
-            solution = eval(f"{a}{op}{b}")
+            solution = _OPS[op](a, b)
         return puzzle, solution
 
     # -----------------------------
@@ -60,7 +74,13 @@ class MysteryPuzzleCreator:
     # -----------------------------
     def generate_random_mystery(self):
         """Return a short mystery scenario."""
-        return f"The {random.choice(self.subjects)} {random.choice(self.actions)} from the {random.choice(self.places)}."
+        # Index with random() directly; cheaper than three choice() calls
+        subjects, actions, places = self.subjects, self.actions, self.places
+        rnd = random.random
+        subject = subjects[int(rnd() * len(subjects))]
+        action = actions[int(rnd() * len(actions))]
+        place = places[int(rnd() * len(places))]
+        return f"The {subject} {action} from the {place}."
 
     # -----------------------------
     # Advanced Puzzle Generators
@@ -76,15 +96,15 @@ class MysteryPuzzleCreator:
             a, b = random.randint(100, 500), random.randint(1, 50)
         op = random.choice(ops)
         puzzle = f"Solve: {a} {op} {b}"
-        solution = eval(f"{a}{op}{b}")
+        solution = _OPS[op](a, b)
         return puzzle, solution
 
     def word_scramble(self):
         """Return a scrambled word puzzle."""
-        word_bank = ["mystery", "puzzle", "enigma", "riddle", "labyrinth", "conundrum", "cipher"]
-        word = random.choice(word_bank)
-        scrambled = "".join(random.sample(word, len(word)))
-        return scrambled, word
+        word, letters = random.choice(self._scramble_words)
+        shuffled = letters.copy()
+        random.shuffle(shuffled)
+        return "".join(shuffled), word
 
     def logic_grid_puzzle(self):
         """Generate a mock logic grid puzzle scenario."""
@@ -3,12 +3,26 @@ neura_router.py
 Auto-registers all NeuraAI routes.
 """
 
-from flask import Flask
+from flask import Flask, request
 from ai_engine import app as base_app
 from voice_routes import voice_bp
 from book_platform import add_book, list_books, get_book
 import json
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+def _json_response(data):
+    """Compact JSON body; ?pretty=1 keeps the indented form for debugging."""
+    pretty = bool(request.args.get("pretty"))
+    if orjson is not None:
+        body = orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    else:
+        body = json.dumps(data, indent=2 if pretty else None, ensure_ascii=False)
+    return base_app.response_class(body, mimetype="application/json")
+
 def create_app():
     app = base_app
 
@@ -19,12 +33,12 @@ def create_app():
     @app.route("/api/books/list")
     def api_list_books():
         data = list_books()
-        return json.dumps(data, indent=2)
+        return _json_response(data)
 
     @app.route("/api/books/<book_id>")
     def api_get_book(book_id):
         book = get_book(book_id)
-        return json.dumps(book or {"error": "not_found"}, indent=2)
+        return _json_response(book or {"error": "not_found"})
 
     return app
 
@@ -6,6 +6,7 @@
 
 import os, sys, logging
 from datetime import datetime
+from functools import lru_cache
 from dotenv import load_dotenv
 
 # -----------------------------
@@ -40,11 +41,20 @@ ENV_KEYS = [
     "NEURA_DEV_FREE_EMAIL", "OPENAI_ENABLED", "LOG_LEVEL"
 ]
 
+@lru_cache(maxsize=1)
+def _env_snapshot() -> dict:
+    """ENV_KEYS values, read once; call reload_env() after the environment changes."""
+    return {key: os.getenv(key) for key in ENV_KEYS}
+
+def reload_env():
+    """Re-read .env and drop the cached snapshot (e.g. from a SIGHUP handler)."""
+    load_dotenv(override=True)
+    _env_snapshot.cache_clear()
+
 def summarize_env():
     logger.info("🛰️  Booting Neuraluxe-AI Environment Check...")
     missing = []
-    for key in ENV_KEYS:
-        val = os.getenv(key)
+    for key, val in _env_snapshot().items():
         if val:
             if "KEY" in key or "PASS" in key:
                 logger.info(f"{key} = ✅ [SECURE VALUE LOADED]")